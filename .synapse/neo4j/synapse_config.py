@@ -32,6 +32,7 @@ _NEO4J_AVAILABLE = None
 _REDIS_AVAILABLE = None
 _SENTENCETRANSFORMER_AVAILABLE = None
 _NUMPY_AVAILABLE = None
+_ORJSON_AVAILABLE = None
 
 
 def check_neo4j_available() -> bool:
@@ -82,6 +83,18 @@ def check_numpy_available() -> bool:
     return _NUMPY_AVAILABLE
 
 
+def check_orjson_available() -> bool:
+    """Check if orjson package is available (lazy)"""
+    global _ORJSON_AVAILABLE
+    if _ORJSON_AVAILABLE is None:
+        try:
+            import orjson
+            _ORJSON_AVAILABLE = True
+        except ImportError:
+            _ORJSON_AVAILABLE = False
+    return _ORJSON_AVAILABLE
+
+
 def resolve_model_path() -> Path:
     """
     Resolve absolute path to BGE-M3 model.
@@ -24,8 +24,10 @@ Design:
 """
 
 import json
+import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -165,18 +167,27 @@ def check_cli_tools_health():
     """
     script_dir = Path(__file__).parent
     tools = {
-        "synapse_search": script_dir / "synapse_search.py",
-        "synapse_standard": script_dir / "synapse_standard.py",
-        "synapse_template": script_dir / "synapse_template.py"
+        "synapse_search": "synapse_search.py",
+        "synapse_standard": "synapse_standard.py",
+        "synapse_template": "synapse_template.py"
     }
 
+    # One directory scan; DirEntry.is_file() uses the cached d_type instead
+    # of a stat() per tool
+    wanted = set(tools.values())
+    with os.scandir(script_dir) as it:
+        entries = {entry.name: entry for entry in it if entry.name in wanted}
+
     results = {}
 
-    for tool_name, tool_path in tools.items():
-        if not tool_path.exists():
+    for tool_name, file_name in tools.items():
+        entry = entries.get(file_name)
+        if entry is None:
             results[tool_name] = "not_found"
-        elif not tool_path.is_file():
-            results[tool_name] = "error"
+        elif not entry.is_file():
+            # A dangling symlink has an entry but no target: report not_found,
+            # as Path.exists() did; only an existing non-file is an error
+            results[tool_name] = "error" if os.path.exists(entry.path) else "not_found"
         else:
             # File exists and is a file - consider it executable
             results[tool_name] = "executable"
@@ -184,7 +195,7 @@ def check_cli_tools_health():
     return results
 
 
-def calculate_overall_status(checks):
+def calculate_overall_status(checks, ready_for_mcp=None):
     """
     Calculate overall system status based on individual checks.
 
@@ -195,22 +206,21 @@ def calculate_overall_status(checks):
 
     Args:
         checks: Dict with neo4j, redis, bge_m3, cli_tools checks
+        ready_for_mcp: Precomputed calculate_ready_for_mcp(checks) result;
+            pass it to avoid re-scanning the critical services
 
     Returns:
         "healthy", "degraded", or "unhealthy"
     """
-    # Critical services
-    neo4j_up = checks["neo4j"]["status"] == "up"
-    all_tools_ok = all(
-        status == "executable"
-        for status in checks["cli_tools"].values()
-    )
+    # Critical services (same predicate as MCP readiness)
+    if ready_for_mcp is None:
+        ready_for_mcp = calculate_ready_for_mcp(checks)
 
     # Optional services
     redis_up = checks["redis"]["status"] == "up"
 
     # Determine status
-    if not neo4j_up or not all_tools_ok:
+    if not ready_for_mcp:
         return "unhealthy"
     elif not redis_up:
         return "degraded"
@@ -256,69 +266,74 @@ def print_usage():
     print("  python synapse_health.py --verbose")
 
 
-def print_human_readable(health_data, verbose=False):
+def format_human_readable(health_data, verbose=False):
     """
-    Print human-readable health status.
+    Format health status as human-readable text.
+
+    Built as a single string so main() emits it with one write instead of
+    a print() per line.
 
     Args:
         health_data: Dict with health check results
-        verbose: If True, show detailed diagnostics
+        verbose: If True, include detailed diagnostics
+
+    Returns:
+        Formatted string for console output
     """
-    print("=== Synapse Health Status ===")
-    print()
+    lines = ["=== Synapse Health Status ===", ""]
 
     # Neo4j
     neo4j = health_data["checks"]["neo4j"]
     status_symbol = "✓" if neo4j["status"] == "up" else "✗"
-    print(f"Neo4j:  {status_symbol} {neo4j['status'].upper()}", end="")
+    line = f"Neo4j:  {status_symbol} {neo4j['status'].upper()}"
     if neo4j["status"] == "up":
-        print(f" ({neo4j['latency_ms']}ms)")
+        lines.append(f"{line} ({neo4j['latency_ms']}ms)")
         if verbose:
-            print(f"  Version: {neo4j.get('version', 'unknown')}")
+            lines.append(f"  Version: {neo4j.get('version', 'unknown')}")
     else:
-        print()
+        lines.append(line)
         if verbose:
-            print(f"  Error: {neo4j.get('error', 'Unknown')}")
+            lines.append(f"  Error: {neo4j.get('error', 'Unknown')}")
 
     # Redis
     redis_info = health_data["checks"]["redis"]
     status_symbol = "✓" if redis_info["status"] == "up" else "✗"
-    print(f"Redis:  {status_symbol} {redis_info['status'].upper()}", end="")
+    line = f"Redis:  {status_symbol} {redis_info['status'].upper()}"
     if redis_info["status"] == "up":
-        print(f" ({redis_info['latency_ms']}ms, optional)")
+        lines.append(f"{line} ({redis_info['latency_ms']}ms, optional)")
     else:
-        print(" (optional)")
+        lines.append(f"{line} (optional)")
         if verbose:
-            print(f"  Error: {redis_info.get('error', 'Unknown')}")
+            lines.append(f"  Error: {redis_info.get('error', 'Unknown')}")
 
     # BGE-M3
     bge_m3 = health_data["checks"]["bge_m3"]
     status_symbol = "✓" if bge_m3["status"] == "available" else "✗"
-    print(f"BGE-M3: {status_symbol} {bge_m3['status'].upper()}")
+    lines.append(f"BGE-M3: {status_symbol} {bge_m3['status'].upper()}")
     if verbose:
         if bge_m3["status"] == "available":
-            print(f"  Path: {bge_m3.get('model_path', 'unknown')}")
+            lines.append(f"  Path: {bge_m3.get('model_path', 'unknown')}")
         else:
-            print(f"  Error: {bge_m3.get('error', 'Unknown')}")
+            lines.append(f"  Error: {bge_m3.get('error', 'Unknown')}")
 
     # CLI Tools
-    print()
-    print("CLI Tools:")
+    lines.append("")
+    lines.append("CLI Tools:")
     cli_tools = health_data["checks"]["cli_tools"]
     for tool_name, tool_status in cli_tools.items():
         status_symbol = "✓" if tool_status == "executable" else "✗"
-        print(f"  {tool_name}: {status_symbol} {tool_status}")
+        lines.append(f"  {tool_name}: {status_symbol} {tool_status}")
 
     # Overall status
-    print()
-    status = health_data["status"]
-    status_upper = status.upper()
-    print(f"Overall Status: {status_upper}")
-    print(f"Ready for MCP: {'YES' if health_data['ready_for_mcp'] else 'NO'}")
+    lines.append("")
+    lines.append(f"Overall Status: {health_data['status'].upper()}")
+    lines.append(f"Ready for MCP: {'YES' if health_data['ready_for_mcp'] else 'NO'}")
 
     if verbose:
-        print()
-        print(f"Timestamp: {health_data['timestamp']}")
+        lines.append("")
+        lines.append(f"Timestamp: {health_data['timestamp']}")
+
+    return "\n".join(lines)
 
 
 def main():
@@ -331,17 +346,28 @@ def main():
     json_mode = "--json" in sys.argv
     verbose = "--verbose" in sys.argv
 
-    # Run health checks
-    checks = {
-        "neo4j": check_neo4j_health(),
-        "redis": check_redis_health(),
-        "bge_m3": check_bge_m3_health(),
-        "cli_tools": check_cli_tools_health()
-    }
+    # Resolve package availability on the main thread so the worker threads
+    # never import neo4j/redis concurrently (and cache a spurious ImportError)
+    check_neo4j_available()
+    check_redis_available()
+
+    # Overlap only the two network-bound checks. BGE-M3 (torch import) and the
+    # CLI tool scan run afterwards on the main thread, so they cannot hold the
+    # GIL while the Neo4j/Redis latency timers are running.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        neo4j_future = executor.submit(check_neo4j_health)
+        redis_future = executor.submit(check_redis_health)
+        checks = {
+            "neo4j": neo4j_future.result(),
+            "redis": redis_future.result()
+        }
+
+    checks["bge_m3"] = check_bge_m3_health()
+    checks["cli_tools"] = check_cli_tools_health()
 
-    # Calculate overall status
-    overall_status = calculate_overall_status(checks)
+    # Calculate overall status (critical services scanned once)
     ready_for_mcp = calculate_ready_for_mcp(checks)
+    overall_status = calculate_overall_status(checks, ready_for_mcp)
 
     # Build health data structure (Phase 1.4 spec)
     health_data = {
@@ -355,7 +381,7 @@ def main():
     if json_mode:
         print(json.dumps(health_data, indent=2))
     else:
-        print_human_readable(health_data, verbose=verbose)
+        print(format_human_readable(health_data, verbose=verbose))
 
 
 if __name__ == "__main__":
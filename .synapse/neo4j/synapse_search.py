@@ -20,6 +20,7 @@ Examples:
     python synapse_search.py "dependency injection" 5 --json
 """
 
+import hashlib
 import json
 import sys
 import time
@@ -81,9 +82,10 @@ def compute_embedding(text: str, use_cache: bool = True) -> List[float]:
     if not text.strip():
         return [0.0] * MODEL_DIMENSIONS  # Empty vector for empty text
 
-    # Try Redis cache first (if enabled)
+    # Try Redis cache first (if enabled); key is hashed once for lookup and store
     if use_cache:
-        cached_embedding = _get_cached_embedding(text)
+        cache_key = _embedding_cache_key(text)
+        cached_embedding = _get_cached_embedding(cache_key)
         if cached_embedding is not None:
             return cached_embedding
 
@@ -99,7 +101,7 @@ def compute_embedding(text: str, use_cache: bool = True) -> List[float]:
 
         # Cache result in Redis (if available)
         if use_cache:
-            _cache_embedding(text, embedding_list)
+            _cache_embedding(cache_key, embedding_list)
 
         return embedding_list
     except Exception as e:
@@ -107,7 +109,13 @@ def compute_embedding(text: str, use_cache: bool = True) -> List[float]:
         return [0.0] * MODEL_DIMENSIONS
 
 
-def _get_cached_embedding(text: str) -> Optional[List[float]]:
+def _embedding_cache_key(text: str) -> str:
+    """Build the Redis cache key for text (prefix + truncated SHA-256)"""
+    text_hash = hashlib.sha256(text.encode()).hexdigest()[:16]
+    return f"{REDIS_CACHE_PREFIX}{text_hash}"
+
+
+def _get_cached_embedding(cache_key: str) -> Optional[List[float]]:
     """Get embedding from Redis cache (returns None if not found)"""
     global _redis_client
 
@@ -119,13 +127,6 @@ def _get_cached_embedding(text: str) -> Optional[List[float]]:
         return None
 
     try:
-        import hashlib
-        import json
-
-        # Create cache key from text hash
-        text_hash = hashlib.sha256(text.encode()).hexdigest()[:16]
-        cache_key = f"{REDIS_CACHE_PREFIX}{text_hash}"
-
         # Try to get from cache
         cached_data = _redis_client.get(cache_key)
         if cached_data:
@@ -137,7 +138,7 @@ def _get_cached_embedding(text: str) -> Optional[List[float]]:
     return None
 
 
-def _cache_embedding(text: str, embedding: List[float]) -> None:
+def _cache_embedding(cache_key: str, embedding: List[float]) -> None:
     """Store embedding in Redis cache (silent failure if unavailable)"""
     global _redis_client
 
@@ -145,13 +146,6 @@ def _cache_embedding(text: str, embedding: List[float]) -> None:
         return
 
     try:
-        import hashlib
-        import json
-
-        # Create cache key from text hash
-        text_hash = hashlib.sha256(text.encode()).hexdigest()[:16]
-        cache_key = f"{REDIS_CACHE_PREFIX}{text_hash}"
-
         # Store with TTL
         _redis_client.setex(
             cache_key,
@@ -228,10 +222,7 @@ def search_patterns(
         }
         return json.dumps(result, indent=2) if json_mode else result
 
-    # Step 1: Compute query embedding
-    query_embedding = compute_embedding(query)
-
-    # Step 2: Query Neo4j for all patterns
+    # Bail out before loading the embedding model if there is nothing to query
     if not check_neo4j_available():
         error_result = {
             "query": query,
@@ -242,6 +233,10 @@ def search_patterns(
         }
         return json.dumps(error_result, indent=2) if json_mode else error_result
 
+    # Step 1: Compute query embedding
+    query_embedding = compute_embedding(query)
+
+    # Step 2: Query Neo4j for all patterns
     # Import here to avoid slow startup
     from neo4j import GraphDatabase
 
@@ -16,15 +16,38 @@ Examples:
 
 import json
 import sys
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 
 # Import shared configuration (DRY principle)
 from synapse_config import (
     NEO4J_URI,
     NEO4J_AUTH,
-    check_neo4j_available
+    check_neo4j_available,
+    check_orjson_available
 )
 
+# JSON encoder chosen once at import: orjson when available, else stdlib json
+# producing the same compact output, so success and error payloads are
+# formatted identically either way
+def _stdlib_json_bytes(obj: Any) -> bytes:
+    """Serialize obj to compact JSON bytes (stdlib json, ASCII-escaped)."""
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+if check_orjson_available():
+    import orjson
+
+    def _json_bytes(obj: Any) -> bytes:
+        """Serialize obj to compact JSON bytes (orjson, stdlib on rejection)."""
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # orjson rejects lone surrogates (non-UTF-8 argv bytes decode to
+            # them on POSIX); stdlib json escapes them as \udcXX instead
+            return _stdlib_json_bytes(obj)
+else:
+    _json_bytes = _stdlib_json_bytes
+
 
 def substitute_variables(content: str, variables: Dict[str, str]) -> str:
     """Substitute {{variable_name}} placeholders with values."""
@@ -46,6 +69,85 @@ def build_file_tree(path: str) -> List[str]:
     return tree
 
 
+def _fetch_template(template_name: str) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    """
+    Query Neo4j for a template's description and raw (unsubstituted) files.
+
+    Kept separate from substitution so get_template() and
+    stream_template_json() share one lookup path.
+
+    Raises:
+        LookupError: Template does not exist in the Pattern Map
+    """
+    from neo4j import GraphDatabase
+
+    driver = GraphDatabase.driver(NEO4J_URI, auth=NEO4J_AUTH)
+    try:
+        with driver.session() as session:
+            query_result = session.run("""
+                MATCH (t:Template {name: $template_name})
+                OPTIONAL MATCH (t)-[:HAS_FILE]->(f:TemplateFile)
+                RETURN t.description as description,
+                       collect({path: f.path, content: f.content}) as files
+            """, template_name=template_name)
+
+            record = query_result.single()
+            if not record:
+                raise LookupError(f"Template '{template_name}' not found")
+
+            # Normalise to str here so substitution and serialization cannot
+            # fail once stream_template_json() has started writing output
+            files = tuple(
+                (str(file_data["path"]), str(file_data.get("content") or ""))
+                for file_data in record.get("files", [])
+                if file_data.get("path") is not None  # Skip empty OPTIONAL MATCH results
+            )
+            return str(record.get("description") or ""), files
+    finally:
+        driver.close()
+
+
+def _lookup_template(template_name: str) -> Tuple[str, Tuple[Tuple[str, str], ...], Optional[str]]:
+    """
+    Fetch raw template data, translating failures into output error messages.
+
+    Returns:
+        (description, files, error) - error is None on success
+    """
+    if not check_neo4j_available():
+        return "", (), "neo4j package not available"
+
+    try:
+        description, files = _fetch_template(template_name)
+    except LookupError as e:
+        return "", (), str(e)
+    except Exception as e:
+        return "", (), f"Neo4j query failed: {str(e)}"
+
+    return description, files, None
+
+
+def _substituted_files(
+    files: Tuple[Tuple[str, str], ...],
+    variables: Dict[str, str]
+) -> Iterator[Tuple[str, str]]:
+    """Yield (path, content) pairs with variable substitution applied."""
+    for path, content in files:
+        yield substitute_variables(path, variables), substitute_variables(content, variables)
+
+
+def _empty_result(template_name: str, variables: Dict[str, str]) -> Dict[str, Any]:
+    """Build the result skeleton shared by get_template() and stream_template_json()."""
+    return {
+        "template_name": template_name,
+        "description": "",
+        "variables": variables,
+        "files": [],
+        "file_tree": [],
+        "source": "Pattern Map"
+    }
+
+
 def get_template(template_name: str, variables: Dict[str, str]) -> Dict[str, Any]:
     """
     Retrieve template from Neo4j and apply variable substitution.
@@ -60,63 +162,74 @@ def get_template(template_name: str, variables: Dict[str, str]) -> Dict[str, Any
             "source": "Pattern Map"
         }
     """
-    result = {
-        "template_name": template_name,
-        "description": "",
-        "variables": variables,
-        "files": [],
-        "file_tree": [],
-        "source": "Pattern Map"
-    }
+    result = _empty_result(template_name, variables)
 
-    if not check_neo4j_available():
-        result["error"] = "neo4j package not available"
+    description, files, error = _lookup_template(template_name)
+    if error is not None:
+        result["error"] = error
         return result
 
-    from neo4j import GraphDatabase
+    result["description"] = description
+    file_tree_set = set()
 
     try:
-        driver = GraphDatabase.driver(NEO4J_URI, auth=NEO4J_AUTH)
-        try:
-            with driver.session() as session:
-                query_result = session.run("""
-                    MATCH (t:Template {name: $template_name})
-                    OPTIONAL MATCH (t)-[:HAS_FILE]->(f:TemplateFile)
-                    RETURN t.description as description,
-                           collect({path: f.path, content: f.content}) as files
-                """, template_name=template_name)
-
-                record = query_result.single()
-                if not record:
-                    result["error"] = f"Template '{template_name}' not found"
-                    return result
-
-                result["description"] = record.get("description", "")
-                file_tree_set = set()
-
-                for file_data in record.get("files", []):
-                    path = file_data.get("path")
-                    if path is None:  # Skip empty OPTIONAL MATCH results
-                        continue
-
-                    # Apply variable substitution to path and content
-                    path_sub = substitute_variables(path, variables)
-                    content_sub = substitute_variables(file_data.get("content", ""), variables)
-
-                    result["files"].append({"path": path_sub, "content": content_sub})
-
-                    # Build file tree
-                    file_tree_set.update(build_file_tree(path_sub))
-
-                result["file_tree"] = sorted(file_tree_set)
-        finally:
-            driver.close()
+        for path_sub, content_sub in _substituted_files(files, variables):
+            result["files"].append({"path": path_sub, "content": content_sub})
+
+            # Build file tree
+            file_tree_set.update(build_file_tree(path_sub))
     except Exception as e:
+        # Same error contract as a failed query: reported in-band, exit 0
         result["error"] = f"Neo4j query failed: {str(e)}"
+        return result
 
+    result["file_tree"] = sorted(file_tree_set)
     return result
 
 
+def stream_template_json(template_name: str, variables: Dict[str, str]) -> None:
+    """
+    Write the get_template() JSON document to stdout incrementally.
+
+    Each file is substituted, serialized and written as it is produced, so the
+    substituted files list and the full serialized document are never held in
+    memory. Lookup errors are emitted via write_json() exactly as get_template()
+    would report them. The header (including variables) is fully serialized
+    before the first write, _fetch_template() yields only str fields, and
+    _json_bytes() falls back to stdlib json for strings orjson rejects (lone
+    surrogates), so encoding cannot fail once output has started; only an
+    I/O error on stdout can cut the document short.
+    """
+    description, files, error = _lookup_template(template_name)
+    if error is not None:
+        result = _empty_result(template_name, variables)
+        result["error"] = error
+        write_json(result)
+        return
+
+    out = sys.stdout.buffer
+    sys.stdout.flush()
+    out.write(
+        b'{"template_name":' + _json_bytes(template_name)
+        + b',"description":' + _json_bytes(description)
+        + b',"variables":' + _json_bytes(variables)
+        + b',"files":['
+    )
+
+    file_tree_set = set()
+    for i, (path_sub, content_sub) in enumerate(_substituted_files(files, variables)):
+        if i:
+            out.write(b",")
+        out.write(_json_bytes({"path": path_sub, "content": content_sub}))
+        file_tree_set.update(build_file_tree(path_sub))
+
+    out.write(
+        b'],"file_tree":' + _json_bytes(sorted(file_tree_set))
+        + b',"source":"Pattern Map"}\n'
+    )
+    out.flush()
+
+
 def format_human_readable(result: Dict[str, Any]) -> str:
     """Format template result as human-readable text."""
     lines = [
@@ -147,14 +260,21 @@ def format_human_readable(result: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+def write_json(payload: Dict[str, Any]) -> None:
+    """Write payload to stdout as one line of compact JSON."""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(_json_bytes(payload) + b"\n")
+    sys.stdout.buffer.flush()
+
+
 def parse_var_arguments(args: List[str]) -> Dict[str, str]:
     """Parse --var key=value arguments from command line."""
     variables = {}
     i = 0
     while i < len(args):
         if args[i] == "--var" and i + 1 < len(args):
-            if "=" in args[i + 1]:
-                key, value = args[i + 1].split("=", 1)
+            key, sep, value = args[i + 1].partition("=")
+            if sep:
                 variables[key.strip()] = value.strip()
             i += 2
         else:
@@ -198,17 +318,20 @@ def main():
     variables = parse_var_arguments(sys.argv[2:])
 
     try:
-        result = get_template(template_name, variables)
-
         if json_mode:
-            print(json.dumps(result, indent=2))
+            stream_template_json(template_name, variables)
         else:
-            print(format_human_readable(result))
+            print(format_human_readable(get_template(template_name, variables)))
 
     except Exception as e:
         error = {"error": str(e), "template_name": template_name, "files": []}
         if json_mode:
-            print(json.dumps(error, indent=2))
+            try:
+                write_json(error)
+            except Exception:
+                # Reporting the error must not raise a second time (e.g. the
+                # stdout failure that caused it); stderr escapes any str
+                print(f"Error: {str(e)}", file=sys.stderr)
         else:
             print(f"Error: {str(e)}", file=sys.stderr)
         sys.exit(1)
@@ -21,6 +21,13 @@ from dotenv import load_dotenv
 import os
 from mcp.server import FastMCP
 
+# orjson parses tool output several times faster; its JSONDecodeError subclasses
+# json.JSONDecodeError, so error handling is identical with either parser
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 # Load environment configuration
 load_dotenv()
 
@@ -51,15 +58,16 @@ def _run_synapse_tool(script_name: str, args: list[str], timeout: int = 60) -> D
     synapse_dir = Path(SYNAPSE_NEO4J_DIR)
     script_path = synapse_dir / script_name
 
-    # Validate directory exists before checking script
-    if not synapse_dir.exists():
-        return {
-            "error": f"Synapse directory not found: {SYNAPSE_NEO4J_DIR}",
-            "suggestion": "Check SYNAPSE_NEO4J_DIR in no3sis/.env",
-            "expected_files": ["synapse_search.py", "synapse_health.py", "context_manager.py", "vector_engine.py"]
-        }
-
+    # Single stat on the happy path; the directory is only checked to pick
+    # the right error message once the script is known to be missing
     if not script_path.exists():
+        if not synapse_dir.exists():
+            return {
+                "error": f"Synapse directory not found: {SYNAPSE_NEO4J_DIR}",
+                "suggestion": "Check SYNAPSE_NEO4J_DIR in no3sis/.env",
+                "expected_files": ["synapse_search.py", "synapse_health.py", "context_manager.py", "vector_engine.py"]
+            }
+
         return {
             "error": f"Synapse tool not found: {script_name}",
             "path": str(script_path),
@@ -91,7 +99,7 @@ def _run_synapse_tool(script_name: str, args: list[str], timeout: int = 60) -> D
 
         # Parse JSON output
         try:
-            return json.loads(result.stdout)
+            return _json_loads(result.stdout)
         except json.JSONDecodeError as e:
             return {
                 "error": "Failed to parse tool output as JSON",
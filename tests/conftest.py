@@ -0,0 +1,26 @@
+"""
+Shared pytest configuration for Synapse CLI tool tests.
+"""
+
+import pytest
+
+
+def pytest_collection_modifyitems(session, config, items):
+    """
+    Skip subprocess-based tests once if their venv interpreter is missing.
+
+    Applies to modules defining PYTHON_BIN; tests marked no_venv (they only
+    inspect SCRIPT_PATH and never run the interpreter) always run.
+    """
+    missing = {}
+    for item in items:
+        module = getattr(item, "module", None)
+        python_bin = getattr(module, "PYTHON_BIN", None)
+        if python_bin is None or item.get_closest_marker("no_venv"):
+            continue
+
+        # One exists() check per module, not per test
+        if module not in missing:
+            missing[module] = not python_bin.exists()
+        if missing[module]:
+            item.add_marker(pytest.mark.skip(reason=f"venv missing: {python_bin}"))
@@ -32,6 +32,20 @@ SCRIPT_PATH = Path(__file__).parent.parent / ".synapse" / "neo4j" / "synapse_hea
 PYTHON_BIN = Path(__file__).parent.parent / ".venv-ml" / "bin" / "python"
 
 
+@pytest.fixture(scope="module")
+def health_json():
+    """Run synapse_health.py --json once and share the parsed report"""
+    result = subprocess.run(
+        [str(PYTHON_BIN), str(SCRIPT_PATH), "--json"],
+        capture_output=True,
+        text=True,
+        timeout=15
+    )
+
+    return json.loads(result.stdout)
+
+
+@pytest.mark.no_venv
 def test_script_exists():
     """Test that synapse_health.py exists"""
     assert SCRIPT_PATH.exists(), f"synapse_health.py not found at {SCRIPT_PATH}"
@@ -81,16 +95,9 @@ def test_json_output_format():
     assert "cli_tools" in checks, "Missing 'cli_tools' check"
 
 
-def test_neo4j_health_check():
+def test_neo4j_health_check(health_json):
     """Test that Neo4j health check returns expected structure"""
-    result = subprocess.run(
-        [str(PYTHON_BIN), str(SCRIPT_PATH), "--json"],
-        capture_output=True,
-        text=True,
-        timeout=15
-    )
-
-    data = json.loads(result.stdout)
+    data = health_json
     neo4j = data["checks"]["neo4j"]
 
     # Required keys in neo4j section
@@ -103,16 +110,9 @@ def test_neo4j_health_check():
         assert neo4j["latency_ms"] >= 0, "latency_ms should be non-negative"
 
 
-def test_redis_health_check():
+def test_redis_health_check(health_json):
     """Test that Redis health check returns expected structure"""
-    result = subprocess.run(
-        [str(PYTHON_BIN), str(SCRIPT_PATH), "--json"],
-        capture_output=True,
-        text=True,
-        timeout=15
-    )
-
-    data = json.loads(result.stdout)
+    data = health_json
     redis_info = data["checks"]["redis"]
 
     # Required keys in redis section
@@ -125,16 +125,9 @@ def test_redis_health_check():
         assert isinstance(redis_info["latency_ms"], (int, float)), "latency_ms should be numeric"
 
 
-def test_bge_m3_model_check():
+def test_bge_m3_model_check(health_json):
     """Test that BGE-M3 model check returns expected structure"""
-    result = subprocess.run(
-        [str(PYTHON_BIN), str(SCRIPT_PATH), "--json"],
-        capture_output=True,
-        text=True,
-        timeout=15
-    )
-
-    data = json.loads(result.stdout)
+    data = health_json
     model = data["checks"]["bge_m3"]
 
     # Required keys in bge_m3 section
@@ -146,16 +139,9 @@ def test_bge_m3_model_check():
         # load_time_ms is optional (may not be measured)
 
 
-def test_cli_tools_check():
+def test_cli_tools_check(health_json):
     """Test that CLI tools executability check works"""
-    result = subprocess.run(
-        [str(PYTHON_BIN), str(SCRIPT_PATH), "--json"],
-        capture_output=True,
-        text=True,
-        timeout=15
-    )
-
-    data = json.loads(result.stdout)
+    data = health_json
     cli_tools = data["checks"]["cli_tools"]
 
     # Required keys - all 3 Phase 1 CLI tools
@@ -169,16 +155,9 @@ def test_cli_tools_check():
             f"Invalid status for {tool_name}: {tool_status}"
 
 
-def test_overall_status_calculation():
+def test_overall_status_calculation(health_json):
     """Test that overall status is computed correctly"""
-    result = subprocess.run(
-        [str(PYTHON_BIN), str(SCRIPT_PATH), "--json"],
-        capture_output=True,
-        text=True,
-        timeout=15
-    )
-
-    data = json.loads(result.stdout)
+    data = health_json
 
     # overall status should be one of: healthy, degraded, unhealthy
     assert data["status"] in ["healthy", "degraded", "unhealthy"], \
@@ -197,16 +176,9 @@ def test_overall_status_calculation():
             "Status should be unhealthy/degraded when CLI tools missing"
 
 
-def test_ready_for_mcp_flag():
+def test_ready_for_mcp_flag(health_json):
     """Test that ready_for_mcp flag is set correctly"""
-    result = subprocess.run(
-        [str(PYTHON_BIN), str(SCRIPT_PATH), "--json"],
-        capture_output=True,
-        text=True,
-        timeout=15
-    )
-
-    data = json.loads(result.stdout)
+    data = health_json
 
     # ready_for_mcp should be boolean
     assert isinstance(data["ready_for_mcp"], bool), "ready_for_mcp should be boolean"
@@ -223,16 +195,9 @@ def test_ready_for_mcp_flag():
         f"ready_for_mcp mismatch: expected {expected_ready}, got {data['ready_for_mcp']}"
 
 
-def test_timestamp_format():
+def test_timestamp_format(health_json):
     """Test that timestamp is in ISO format"""
-    result = subprocess.run(
-        [str(PYTHON_BIN), str(SCRIPT_PATH), "--json"],
-        capture_output=True,
-        text=True,
-        timeout=15
-    )
-
-    data = json.loads(result.stdout)
+    data = health_json
 
     # Timestamp should be ISO 8601 format
     from datetime import datetime
@@ -281,16 +246,9 @@ def test_human_readable_output():
     assert "status" in output.lower() or "Status" in output
 
 
-def test_latency_tracking():
+def test_latency_tracking(health_json):
     """Test that latency is tracked for each service"""
-    result = subprocess.run(
-        [str(PYTHON_BIN), str(SCRIPT_PATH), "--json"],
-        capture_output=True,
-        text=True,
-        timeout=15
-    )
-
-    data = json.loads(result.stdout)
+    data = health_json
 
     # Neo4j should have latency if up
     if data["checks"]["neo4j"]["status"] == "up":
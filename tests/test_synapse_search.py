@@ -29,6 +29,7 @@ SCRIPT_PATH = Path(__file__).parent.parent / ".synapse" / "neo4j" / "synapse_sea
 PYTHON_BIN = Path(__file__).parent.parent / ".venv-ml" / "bin" / "python"
 
 
+@pytest.mark.no_venv
 def test_script_exists():
     """Test that synapse_search.py exists"""
     assert SCRIPT_PATH.exists(), f"synapse_search.py not found at {SCRIPT_PATH}"
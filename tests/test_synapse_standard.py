@@ -27,7 +27,11 @@ import pytest
 SCRIPT_PATH = Path(__file__).parent.parent / ".synapse" / "neo4j" / "synapse_standard.py"
 PYTHON_BIN = Path(__file__).parent.parent / ".venv-ml" / "bin" / "python"
 
+# Languages the Pattern Map ships standards for
+VALID_LANGUAGES = ("python", "rust", "typescript")
 
+
+@pytest.mark.no_venv
 def test_script_exists():
     """Test that synapse_standard.py exists"""
     assert SCRIPT_PATH.exists(), f"synapse_standard.py not found at {SCRIPT_PATH}"
@@ -83,40 +87,11 @@ def test_json_output_format():
     assert isinstance(data["standards"], list), "standards should be a list"
 
 
-def test_valid_language_python():
-    """Test that valid language 'python' is accepted"""
-    result = subprocess.run(
-        [str(PYTHON_BIN), str(SCRIPT_PATH), "python", "--json"],
-        capture_output=True,
-        text=True,
-        timeout=10
-    )
-
-    assert result.returncode == 0
-    data = json.loads(result.stdout)
-    assert data["language"] == "python"
-    assert isinstance(data["standards"], list)
-
-
-def test_valid_language_rust():
-    """Test that valid language 'rust' is accepted"""
-    result = subprocess.run(
-        [str(PYTHON_BIN), str(SCRIPT_PATH), "rust", "--json"],
-        capture_output=True,
-        text=True,
-        timeout=10
-    )
-
-    assert result.returncode == 0
-    data = json.loads(result.stdout)
-    assert data["language"] == "rust"
-    assert isinstance(data["standards"], list)
-
-
-def test_valid_language_typescript():
-    """Test that valid language 'typescript' is accepted"""
+@pytest.mark.parametrize("language", VALID_LANGUAGES)
+def test_valid_language(language):
+    """Test that each supported language is accepted"""
     result = subprocess.run(
-        [str(PYTHON_BIN), str(SCRIPT_PATH), "typescript", "--json"],
+        [str(PYTHON_BIN), str(SCRIPT_PATH), language, "--json"],
         capture_output=True,
         text=True,
         timeout=10
@@ -124,7 +99,7 @@ def test_valid_language_typescript():
 
     assert result.returncode == 0
     data = json.loads(result.stdout)
-    assert data["language"] == "typescript"
+    assert data["language"] == language
     assert isinstance(data["standards"], list)
 
 
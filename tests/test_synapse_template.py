@@ -17,43 +17,98 @@ Tests cover:
 """
 
 import json
+import os
+import socket
 import subprocess
 import sys
 from pathlib import Path
 
 import pytest
 
+# Per-test limit (pytest-timeout) covering fixture setup as well; the
+# subprocess.run timeout below still bounds each call if the plugin is absent
+pytestmark = pytest.mark.timeout(10)
+SUBPROCESS_TIMEOUT = 10
+
 # Path to the synapse_template.py script (will be created in Green phase)
 SCRIPT_PATH = Path(__file__).parent.parent / ".synapse" / "neo4j" / "synapse_template.py"
 PYTHON_BIN = Path(__file__).parent.parent / ".venv-ml" / "bin" / "python"
 
+# String forms resolved once; every test builds its command from these
+PYTHON_BIN_S = str(PYTHON_BIN)
+SCRIPT_PATH_S = str(SCRIPT_PATH)
+CMD_BASE = [PYTHON_BIN_S, SCRIPT_PATH_S, "fastapi-service", "--json"]
+
+# Minimal environment for subprocess runs: smaller exec payload than inheriting
+# the full CI environment, and close_fds=False skips the inherited-fd close loop
+SLIM_ENV = {
+    k: os.environ[k]
+    for k in ("PATH", "HOME", "LANG", "LC_ALL")
+    if k in os.environ
+}
+
+# Top-level keys every --json template response must carry
+EXPECTED_TEMPLATE_KEYS = frozenset({
+    "template_name", "description", "variables", "files", "file_tree", "source"
+})
+
+# Neo4j Bolt endpoint (matches NEO4J_URI in synapse_config.py)
+NEO4J_ADDRESS = ("localhost", 17687)
+
+
+def _neo4j_reachable() -> bool:
+    """Probe the Neo4j Bolt port once with a short timeout"""
+    try:
+        with socket.create_connection(NEO4J_ADDRESS, timeout=0.25):
+            return True
+    except OSError:
+        return False
+
+
+# Probed once at import. The query tests run either way (a downed database is
+# reported in-band); this only selects which degraded-mode assertions apply.
+NEO4J_UP = _neo4j_reachable()
+
 
+@pytest.mark.no_venv
 def test_script_exists():
     """Test that synapse_template.py exists"""
     assert SCRIPT_PATH.exists(), f"synapse_template.py not found at {SCRIPT_PATH}"
 
 
-def test_script_executable():
-    """Test that synapse_template.py can be executed with --help"""
-    result = subprocess.run(
-        [str(PYTHON_BIN), str(SCRIPT_PATH), "--help"],
+@pytest.fixture(scope="module")
+def cli_probe():
+    """Run the --help and missing-argument invocations once; return both results"""
+    help_result = subprocess.run(
+        [PYTHON_BIN_S, SCRIPT_PATH_S, "--help"],
+        capture_output=True,
+        text=True,
+        timeout=SUBPROCESS_TIMEOUT,
+        env=SLIM_ENV,
+        close_fds=False
+    )
+    missing_result = subprocess.run(
+        [PYTHON_BIN_S, SCRIPT_PATH_S],
         capture_output=True,
         text=True,
-        timeout=5
+        timeout=SUBPROCESS_TIMEOUT,
+        env=SLIM_ENV,
+        close_fds=False
     )
+    return help_result, missing_result
+
+
+def test_script_executable(cli_probe):
+    """Test that synapse_template.py can be executed with --help"""
+    result, _ = cli_probe
     # Script should show usage and exit gracefully
     assert result.returncode == 0, f"Script crashed: {result.stderr}"
     assert "usage" in result.stdout.lower() or "help" in result.stdout.lower()
 
 
-def test_missing_template_argument():
+def test_missing_template_argument(cli_probe):
     """Test that missing template_name argument shows usage"""
-    result = subprocess.run(
-        [str(PYTHON_BIN), str(SCRIPT_PATH)],
-        capture_output=True,
-        text=True,
-        timeout=5
-    )
+    _, result = cli_probe
     # Should exit with error code
     assert result.returncode == 1
     assert "usage" in result.stdout.lower() or "usage" in result.stderr.lower()
@@ -62,10 +117,12 @@ def test_missing_template_argument():
 def test_json_output_format():
     """Test that --json flag produces valid JSON output"""
     result = subprocess.run(
-        [str(PYTHON_BIN), str(SCRIPT_PATH), "fastapi-service", "--json"],
+        CMD_BASE,
         capture_output=True,
         text=True,
-        timeout=10
+        timeout=SUBPROCESS_TIMEOUT,
+        env=SLIM_ENV,
+        close_fds=False
     )
 
     assert result.returncode == 0, f"Script failed: {result.stderr}"
@@ -77,12 +134,12 @@ def test_json_output_format():
         assert False, f"Invalid JSON output: {e}\nOutput: {result.stdout}"
 
     # Validate required keys
-    assert "template_name" in data, "Missing 'template_name' key"
-    assert "description" in data, "Missing 'description' key"
-    assert "variables" in data, "Missing 'variables' key"
-    assert "files" in data, "Missing 'files' key"
-    assert "file_tree" in data, "Missing 'file_tree' key"
-    assert "source" in data, "Missing 'source' key"
+    missing = EXPECTED_TEMPLATE_KEYS - data.keys()
+    assert not missing, f"Missing keys: {sorted(missing)}"
+
+    # Degraded mode: unreachable Neo4j must be reported in-band, not by crashing
+    if not NEO4J_UP:
+        assert "error" in data, "Missing 'error' key while Neo4j is unreachable"
     assert isinstance(data["files"], list), "files should be a list"
     assert isinstance(data["file_tree"], list), "file_tree should be a list"
     assert isinstance(data["variables"], dict), "variables should be a dict"
@@ -91,10 +148,12 @@ def test_json_output_format():
 def test_valid_template_retrieval():
     """Test that valid template name retrieves template"""
     result = subprocess.run(
-        [str(PYTHON_BIN), str(SCRIPT_PATH), "fastapi-service", "--json"],
+        CMD_BASE,
         capture_output=True,
         text=True,
-        timeout=10
+        timeout=SUBPROCESS_TIMEOUT,
+        env=SLIM_ENV,
+        close_fds=False
     )
 
     assert result.returncode == 0
@@ -106,10 +165,12 @@ def test_valid_template_retrieval():
 def test_invalid_template_returns_error():
     """Test that invalid template returns helpful error"""
     result = subprocess.run(
-        [str(PYTHON_BIN), str(SCRIPT_PATH), "nonexistent-template", "--json"],
+        [PYTHON_BIN_S, SCRIPT_PATH_S, "nonexistent-template", "--json"],
         capture_output=True,
         text=True,
-        timeout=10
+        timeout=SUBPROCESS_TIMEOUT,
+        env=SLIM_ENV,
+        close_fds=False
     )
 
     # Should either exit with error or return error in JSON
@@ -123,54 +184,49 @@ def test_invalid_template_returns_error():
         assert "error" in data or len(data["files"]) == 0
 
 
-def test_variable_substitution_single():
-    """Test that single --var flag substitutes variables correctly"""
+def test_non_utf8_template_name_returns_json():
+    """Test that a template name with non-UTF-8 bytes still yields valid JSON"""
     result = subprocess.run(
-        [str(PYTHON_BIN), str(SCRIPT_PATH), "fastapi-service",
-         "--var", "project_name=myapi", "--json"],
+        [PYTHON_BIN_S, SCRIPT_PATH_S, b"bad\xff", "--json"],
         capture_output=True,
         text=True,
-        timeout=10
+        timeout=SUBPROCESS_TIMEOUT,
+        env=SLIM_ENV,
+        close_fds=False
     )
 
-    assert result.returncode == 0
+    assert result.returncode == 0, f"Script failed: {result.stderr}"
     data = json.loads(result.stdout)
-    assert "variables" in data
-    assert "project_name" in data["variables"]
-    assert data["variables"]["project_name"] == "myapi"
+    assert data["template_name"].startswith("bad")
 
 
-def test_variable_substitution_multiple():
-    """Test that multiple --var flags work correctly"""
+@pytest.fixture(scope="module")
+def fastapi_service_with_vars():
+    """Run fastapi-service once with shared --var flags and return parsed JSON"""
     result = subprocess.run(
-        [str(PYTHON_BIN), str(SCRIPT_PATH), "fastapi-service",
-         "--var", "project_name=myapi",
-         "--var", "port=8080",
-         "--json"],
+        CMD_BASE + ["--var", "project_name=myapi", "--var", "port=8080"],
         capture_output=True,
         text=True,
-        timeout=10
+        timeout=SUBPROCESS_TIMEOUT,
+        env=SLIM_ENV,
+        close_fds=False
     )
 
-    assert result.returncode == 0
-    data = json.loads(result.stdout)
+    assert result.returncode == 0, f"Script failed: {result.stderr}"
+    return json.loads(result.stdout)
+
+
+def test_variable_substitution_multiple(fastapi_service_with_vars):
+    """Test that repeated --var flags are each recorded in variables"""
+    data = fastapi_service_with_vars
     assert "variables" in data
     assert data["variables"]["project_name"] == "myapi"
     assert data["variables"]["port"] == "8080"
 
 
-def test_variable_substitution_in_content():
+def test_variable_substitution_in_content(fastapi_service_with_vars):
     """Test that variables are substituted in file content"""
-    result = subprocess.run(
-        [str(PYTHON_BIN), str(SCRIPT_PATH), "fastapi-service",
-         "--var", "project_name=testapp", "--json"],
-        capture_output=True,
-        text=True,
-        timeout=10
-    )
-
-    assert result.returncode == 0
-    data = json.loads(result.stdout)
+    data = fastapi_service_with_vars
 
     # If files exist, check that variable placeholders are replaced
     if len(data["files"]) > 0:
@@ -186,10 +242,12 @@ def test_variable_substitution_in_content():
 def test_file_tree_structure():
     """Test that file_tree contains valid paths"""
     result = subprocess.run(
-        [str(PYTHON_BIN), str(SCRIPT_PATH), "fastapi-service", "--json"],
+        CMD_BASE,
         capture_output=True,
         text=True,
-        timeout=10
+        timeout=SUBPROCESS_TIMEOUT,
+        env=SLIM_ENV,
+        close_fds=False
     )
 
     assert result.returncode == 0
@@ -204,10 +262,12 @@ def test_file_tree_structure():
 def test_file_structure():
     """Test that file objects have expected structure"""
     result = subprocess.run(
-        [str(PYTHON_BIN), str(SCRIPT_PATH), "fastapi-service", "--json"],
+        CMD_BASE,
         capture_output=True,
         text=True,
-        timeout=10
+        timeout=SUBPROCESS_TIMEOUT,
+        env=SLIM_ENV,
+        close_fds=False
     )
 
     assert result.returncode == 0
@@ -227,10 +287,12 @@ def test_file_structure():
 def test_human_readable_output():
     """Test that script produces human-readable output without --json"""
     result = subprocess.run(
-        [str(PYTHON_BIN), str(SCRIPT_PATH), "fastapi-service"],
+        [PYTHON_BIN_S, SCRIPT_PATH_S, "fastapi-service"],
         capture_output=True,
         text=True,
-        timeout=10
+        timeout=SUBPROCESS_TIMEOUT,
+        env=SLIM_ENV,
+        close_fds=False
     )
 
     assert result.returncode == 0
@@ -251,10 +313,12 @@ def test_neo4j_connection_failure_handling():
 def test_empty_template_scenario():
     """Test that empty template (no files) returns empty list"""
     result = subprocess.run(
-        [str(PYTHON_BIN), str(SCRIPT_PATH), "fastapi-service", "--json"],
+        CMD_BASE,
         capture_output=True,
         text=True,
-        timeout=10
+        timeout=SUBPROCESS_TIMEOUT,
+        env=SLIM_ENV,
+        close_fds=False
     )
 
     assert result.returncode == 0